@@ -1,16 +1,24 @@
 import codecs
+import csv
+import errno
+import functools
 import os
-import re
 import shutil
 import sys
 import tempfile
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from logging import DEBUG, INFO, basicConfig, getLogger
 from pathlib import Path
-from typing import Any, ClassVar, Final, Self
+from typing import Annotated, Any, Final, Protocol, Self, TextIO
 
 import yaml
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    BeforeValidator,
     ConfigDict,
     DirectoryPath,
     Field,
@@ -22,75 +30,94 @@ from pydantic import (
     model_validator,
 )
 
+try:  # The C-backed loader is available only if PyYAML is built with libyaml.
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
-class EncodingStr:
-    """Represents a validated string that must be a valid text encoding name.
 
-    Validates whether the provided string is a supported encoding.
-    """
+def _strip_str(arg: Any) -> str:
+    """Ensures that the value is a string and strips surrounding whitespace."""
 
-    def __init__(self, value: Any):
-        self.__validate_value(value)
-        self.__value: str = value
+    if not isinstance(arg, str):
+        raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
+    return arg.strip()
 
-    def __str__(self) -> str:
-        return self.__value
 
-    @staticmethod
-    def __validate_value(arg: Any) -> str:
-        if not isinstance(arg, str):
-            raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
+@functools.cache
+def _validate_encoding(arg: str) -> str:
+    """Ensures that the string is a supported text encoding name.
 
-        try:
-            codecs.lookup(arg)
-        except LookupError as err:
-            raise ValueError(f'"{arg}" is not supported as an encoding string.') from err
-        return arg
+    Cached since the same few encodings are validated for every encoding field.
+    """
+
+    try:
+        codecs.lookup(arg)
+    except LookupError as err:
+        raise ValueError(f'"{arg}" is not supported as an encoding string.') from err
+    return arg
+
+
+EncodingStr = Annotated[str, BeforeValidator(_strip_str), AfterValidator(_validate_encoding)]
+"""A validated string that must be a valid text encoding name."""
 
 
 class FilesContainingFolder:
     """Represents a folder that directly contains files to be processed.
 
-    This class validates that the specified folder exists, is readable,
-    and contains only files (no subfolders). It also provides access
-    to the folder path and its contained file paths as immutable tuples.
+    This class validates that the specified folder exists. The contained files
+    are not kept but scanned on each iteration, and the folder is validated to
+    be readable and to contain only files (no subfolders) during the scan.
 
     Attributes:
         __path (Path): Path object of the target folder.
-        __file_paths (tuple[Path, ...]): Tuple of file paths contained in the folder.
-
-    Raises:
-        PermissionError: If the folder cannot be read due to insufficient permissions.
-        FileNotFoundError: If the folder is empty, or
-                           if a non-file object (e.g., subdirectory) exists in the folder.
     """
 
+    __slots__ = ('__path',)
+
     def __init__(self, path: Path):
         self.__path = path
 
         if not self.__path.is_dir():
             raise ValueError(f'It is not an existing folder.: "{self.__path}"')
 
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def iter_file_paths(self) -> Iterator[Path]:
+        """Scans the folder and yields the paths of the files in it.
+
+        The folder is validated in the same single pass, so the errors are
+        raised after all the files have been yielded.
+
+        Yields:
+            Path: Path of a file contained in the folder.
+
+        Raises:
+            PermissionError: If the folder cannot be read due to insufficient permissions.
+            ValueError: If the folder is empty, or
+                        if a non-file object (e.g., subdirectory) exists in the folder.
+        """
+
+        has_child = False
+        has_non_file = False
         try:
-            child_paths = tuple(self.__path.iterdir())
+            with os.scandir(self.__path) as entries:
+                for child_entry in entries:
+                    has_child = True
+                    # DirEntry caches the file type, so no extra stat is needed.
+                    if not child_entry.is_file():
+                        has_non_file = True
+                        continue
+                    yield Path(child_entry.path)
         except PermissionError as err:
             raise PermissionError(f'No read permission for the folder.: "{self.__path}"') from err
 
-        if not child_paths:
+        if not has_child:
             raise ValueError(f'No files were found in the folder.: "{self.__path}"')
-
-        for child_path in child_paths:
-            if not child_path.is_file():
-                raise ValueError(f'Non-file object in the folder.: "{self.__path}"')
-        self.__file_paths = child_paths
-
-    @property
-    def path(self) -> Path:
-        return self.__path
-
-    @property
-    def file_paths(self) -> tuple[Path, ...]:
-        return self.__file_paths
+        if has_non_file:
+            raise ValueError(f'Non-file object in the folder.: "{self.__path}"')
 
 
 class TxtsInFolderConfig(BaseModel):
@@ -102,27 +129,35 @@ class TxtsInFolderConfig(BaseModel):
     """
 
     ENCODING: EncodingStr
-    FOLDER_PATH: FilesContainingFolder
+    FOLDER_PATH: DirectoryPath  # Must be existing directory
 
-    model_config = ConfigDict(
-        frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
-    )
+    __files_containing_folder: FilesContainingFolder = PrivateAttr()
 
-    @field_validator('ENCODING', mode='before')
-    @classmethod
-    def __convert_str_to_encoding_str_and_validate(cls, arg: Any) -> EncodingStr:
-        if not isinstance(arg, str):
-            raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
-        return EncodingStr(arg.strip())
+    model_config = ConfigDict(frozen=True, extra='forbid', strict=True)
 
     @field_validator('FOLDER_PATH', mode='before')
     @classmethod
-    def __convert_str_to_files_containing_folder_and_validate(
-        cls, arg: Any
-    ) -> FilesContainingFolder:
+    def __convert_str_to_path(cls, arg: Any) -> Path:
         if not isinstance(arg, str):
             raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
-        return FilesContainingFolder(Path(arg.strip()))
+        return Path(arg.strip())
+
+    @model_validator(mode='after')
+    def __compute_files_containing_folder(self) -> Self:
+        """Keeps the folder containing the txts.
+
+        The contents of the folder are validated when the txts are read.
+
+        Returns:
+            Self: The validated instance.
+        """
+
+        self.__files_containing_folder = FilesContainingFolder(self.FOLDER_PATH)
+        return self
+
+    @property
+    def files_containing_folder(self) -> FilesContainingFolder:
+        return self.__files_containing_folder
 
 
 class MoveFromConfig(BaseModel):
@@ -141,6 +176,7 @@ class CharsToEscapeInPath:
     """Utility for defining characters that must be escaped in file paths."""
 
     __CHARS = r'"<>:/\|?*'
+    __CHAR_SET = frozenset(__CHARS)
 
     def __new__(cls, *args, **kwargs):
         raise AttributeError('An instance cannot be generate from this class.')
@@ -148,25 +184,32 @@ class CharsToEscapeInPath:
     def __init__(self, *args, **kwargs):
         raise AttributeError('An instance cannot be generate from this class.')
 
-    # @classmethod
-    # def get_match_char_regex(cls) -> str:
-    #     """Return a regex pattern that matches characters to be escaped.
-
-    #     Returns:
-    #         str: Regex pattern string.
-    #     """
-
-    #     return fr'[{re.escape(cls.__CHARS)}]'
-
     @classmethod
-    def get_unmatch_char_regex(cls) -> str:
-        """Return a regex pattern that matches any character not in the escape list.
+    def includes(cls, char: str) -> bool:
+        """Return whether the character is in the escape list.
+
+        Args:
+            char (str): Character to check.
 
         Returns:
-            str: Regex pattern string.
+            bool: True if the character must be escaped.
         """
 
-        return fr'[^{re.escape(cls.__CHARS)}]'
+        return char in cls.__CHAR_SET
+
+
+def _validate_path_join_char(arg: str) -> str:
+    """Ensures that the char is not one of the characters to be escaped in file paths."""
+
+    if CharsToEscapeInPath.includes(arg):
+        raise ValueError(f'"{arg}" cannot be used as a path joining char.')
+    return arg
+
+
+PathJoinChar = Annotated[
+    StrictStr, Field(min_length=1, max_length=1), AfterValidator(_validate_path_join_char)
+]
+"""A single char which can be used to join path parts into a file name."""
 
 
 class MoveToConfig(BaseModel):
@@ -178,9 +221,7 @@ class MoveToConfig(BaseModel):
     """
 
     FOLDER_PATH: DirectoryPath  # Must be existing directory
-    TARGET_FILES_PATH_JOIN_CHAR: StrictStr = Field(
-        min_length=1, max_length=1, pattern=CharsToEscapeInPath.get_unmatch_char_regex()
-    )
+    TARGET_FILES_PATH_JOIN_CHAR: PathJoinChar
 
     model_config = ConfigDict(frozen=True, extra='forbid', strict=True)
 
@@ -229,9 +270,7 @@ class NewTxtConfig(BaseModel):
     PATH: NewPath  # Must not exist & parent must exist
     ENCODING: EncodingStr
 
-    model_config = ConfigDict(
-        frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
-    )
+    model_config = ConfigDict(frozen=True, extra='forbid', strict=True)
 
     @field_validator('PATH', mode='before')
     @classmethod
@@ -240,13 +279,6 @@ class NewTxtConfig(BaseModel):
             raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
         return Path(arg.strip())
 
-    @field_validator('ENCODING', mode='before')
-    @classmethod
-    def __convert_str_to_encoding_str_and_validate(cls, arg: Any) -> EncodingStr:
-        if not isinstance(arg, str):
-            raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
-        return EncodingStr(arg.strip())
-
 
 class Config(BaseModel):
     """Main configuration object loaded from YAML.
@@ -278,9 +310,10 @@ class Config(BaseModel):
             Config: Parsed configuration object.
         """
 
-        with open(path, 'r', encoding='utf-8') as fr:
-            content = yaml.safe_load(fr)
-        return cls(**content)
+        # The loader decodes the bytes itself (UTF-8 or UTF-16 by BOM).
+        with open(path, 'rb') as fr:
+            content = yaml.load(fr, Loader=YamlSafeLoader)
+        return cls.model_validate(content)
 
 
 class PathsListingFile:
@@ -307,21 +340,14 @@ class PathsListingFile:
             ValueError: If the file contains no valid paths or duplicated paths.
         """
 
-        content = self.__path.read_text(encoding=str(self.__encoding))
-        lines = content.split('\n')
-        paths = [Path(stripped_line) for line in lines if (stripped_line := line.strip())]
+        # Iterate lines of the opened file not to hold the whole content as a single str.
+        with self.__path.open('r', encoding=self.__encoding) as fr:
+            paths = [Path(stripped_line) for line in fr if (stripped_line := line.strip())]
 
         if not paths:
             raise ValueError(f'No valid paths are listed in the file.: "{self.__path}"')
 
-        duplicated_paths: list[Path] = []
-        seen: set[Path] = set()
-        for path in paths:
-            if path not in seen:
-                seen.add(path)
-                continue
-            if path not in duplicated_paths:
-                duplicated_paths.append(path)
+        duplicated_paths = [path for path, count in Counter(paths).items() if count > 1]
 
         if duplicated_paths:
             joined_paths = '", "'.join(str(path) for path in duplicated_paths)
@@ -332,237 +358,346 @@ class PathsListingFile:
         return paths
 
 
-class ExistingAbsoluteFilePath:
-    """Represents an existing file path that must be absolute.
+# Upper bound of the file name length search when the file system reports no limit.
+# This is the longest path length on Windows, so no file name can be longer.
+_FILE_NAME_LENGTH_SEARCH_UPPER_BOUND: Final = 32767
 
-    Ensures that the given path refers to a real file and is an absolute path.
 
-    Attributes:
-        __PATH (Path): The validated absolute file path.
-    """
+@functools.cache
+def _get_file_path_length_limit() -> int:
+    """Probes the longest file path length which can be created on this file system.
 
-    def __init__(self, path: Path):
+    Binary-searches the longest file name which can actually be created in a temp directory,
+    so that this costly probe runs only once per process.
 
-        if not isinstance(path, Path):
-            raise TypeError(f'The arg must be a pathlib.Path, but [{type(path)}]')
+    Returns:
+        int: The longest creatable file path length.
+    """
 
-        self.__PATH = path
-        if not self.__PATH.is_file():
-            raise ValueError(f'A file of the arg path does not exist.: "{path}"')
-        if not self.__PATH.is_absolute():
-            raise ValueError(
-                f'A file of the arg path exists, but the path is not absolute.: "{path}"'
-            )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # A single file is created in the temp directory, so the file name limit bounds the search.
+        try:
+            upper_len = os.pathconf(tmpdir, 'PC_NAME_MAX')
+        except (AttributeError, OSError, ValueError):  # No pathconf (Windows) or not supported
+            upper_len = -1
+        if upper_len <= 0:  # No fixed limit is reported
+            upper_len = _FILE_NAME_LENGTH_SEARCH_UPPER_BOUND
+
+        creatable_len, uncreatable_len = 0, upper_len + 1
+        while uncreatable_len - creatable_len > 1:
+            file_name_len = (creatable_len + uncreatable_len) // 2
+            dummy_path = Path(tmpdir) / ('x' * file_name_len)
+            try:
+                dummy_path.touch(exist_ok=False)
+            except OSError:
+                uncreatable_len = file_name_len
+                continue
+            dummy_path.unlink()
+            creatable_len = file_name_len
 
-    def __str__(self) -> str:
-        return self.__PATH.__str__()
+        return len(tmpdir) + 1 + creatable_len  # 1 = len of "/"
 
-    @property
-    def parts(self) -> tuple[str, ...]:
-        return self.__PATH.parts
 
-    @property
-    def parent(self) -> Path:
-        return self.__PATH.parent
+@functools.cache
+def is_writable_folder(path: str | Path) -> bool:
+    """Checks whether a file can be created in the folder, probing each folder only once.
 
+    On Windows, os.access ignores ACLs and reports every folder as writable,
+    so a temp file is actually created and removed there instead.
 
-class MoveFileAsAbsolutePathJoinedNameConfig(BaseModel):
-    """Configuration for moving a file with a destination name derived
-    from its absolute path.
+    Args:
+        path (str | Path): Folder to check.
 
-    Attributes:
-        source_file_path (ExistingAbsoluteFilePath): The source file to move.
-        destination_folder_path (Path): Target folder where the file will be moved.
-        path_join_char (str): Character used to join path components to form the new filename.
-        do_copy (bool):
-            If false, files will be moved.
-            If true, files will be copied and will remain in the original path.
-        __destination_file_path (Path): Final computed destination file path.
-        __verified_file_path_len (int): Path length already verified to be able to exist.
+    Returns:
+        bool: True if the folder is writable.
     """
 
-    source_file_path: ExistingAbsoluteFilePath
-    destination_folder_path: Path
-    path_join_char: StrictStr = Field(
-        min_length=1, max_length=1, pattern=CharsToEscapeInPath.get_unmatch_char_regex()
-    )
-    do_copy: StrictBool
+    if os.name != 'nt':
+        return os.access(path, os.W_OK)
 
-    __destination_file_path: Path = PrivateAttr()
-    __verified_file_path_len: ClassVar[int] = 0
+    temp_file_path = Path(path) / '.tempfile'
+    try:
+        temp_file_path.touch()
+    except PermissionError:
+        return False
+    temp_file_path.unlink(missing_ok=True)
+    return True
 
-    model_config = ConfigDict(
-        frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
-    )
 
-    @field_validator('source_file_path', mode='after')
-    @classmethod
-    def __validate_source_file_path(
-        cls, arg: ExistingAbsoluteFilePath
-    ) -> ExistingAbsoluteFilePath:
-        """Validates that the source file is readable and its parent directory is writable.
+def _is_readable_file(path: str) -> bool:
+    """Checks whether the file can be read.
 
-        Args:
-            arg (ExistingAbsoluteFilePath): The source file path to validate.
+    os.access checks with the real uid/gid, which only differs for setuid runs, and
+    ignores ACLs. On Windows it is always true for an existing file, so the file is
+    actually opened there instead.
 
-        Returns:
-            ExistingAbsoluteFilePath: The validated source file path.
+    Args:
+        path (str): File to check.
 
-        Raises:
-            PermissionError: If the source file is not readable or its parent folder is not writable.
-        """
+    Returns:
+        bool: True if the file is readable.
+    """
 
-        try:
-            with open(str(arg), 'rb'):
-                pass
-        except PermissionError as err:
-            raise PermissionError(f'No read permission for source file.: "{arg}"') from err
+    if os.name != 'nt':
+        return os.access(path, os.R_OK)
 
-        src_parent_path = arg.parent
-        temp_file_path = src_parent_path / '.tempfile'
-        try:
-            temp_file_path.touch()
-        except PermissionError as err:
-            raise PermissionError(
-                f'No write permission on parent folder of source file.: "{src_parent_path}"'
-            ) from err
-        os.remove(temp_file_path)
+    try:
+        with open(path, 'rb'):
+            pass
+    except PermissionError:
+        return False
+    return True
 
-        return arg
 
-    @classmethod
-    def __check_path_length(cls, arg: Path):
-        """Validate path length by actually testing file creation in a temp directory.
+def _check_path_length(path: Path):
+    """Validate path length against the limit probed on this file system.
 
-        Args:
-            arg (Path): Path to check (not actually created).
+    Args:
+        path (Path): Path to check (not actually created).
 
-        Raises:
-            ValueError: If the simulated path length exceeds the file system limit.
-        """
+    Raises:
+        ValueError: If the path length exceeds the file system limit.
+    """
 
-        if os.name == 'nt':  # Windows
-            file_path_len = len(str(arg))
-        else:  # Other OS
-            file_path_len = len(str(arg).encode('utf-8'))
+    if os.name == 'nt':  # Windows
+        file_path_len = len(str(path))
+    else:  # Other OS
+        file_path_len = len(str(path).encode('utf-8'))
 
-        if file_path_len <= cls.__verified_file_path_len:
-            return
-        else:
-            cls.__verified_file_path_len = file_path_len
+    if file_path_len > _get_file_path_length_limit():
+        raise ValueError(
+            f'Path length "{file_path_len}" likely exceeds this file system\'s limit.: "{path}"'
+        )
 
-        try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                file_name_len = max(1, file_path_len - len(tmpdir) - 1)  # 1 = len of "/"
-                dummy_path = Path(tmpdir) / ('x' * file_name_len)
-                dummy_path.touch(exist_ok=False)
-        except OSError as err:
-            raise ValueError(
-                f'Path length "{file_path_len}" likely exceeds this file system\'s limit.: "{arg}"'
-            ) from err
 
-    @field_validator('destination_folder_path', mode='after')
-    @classmethod
-    def __validate_destination_folder_path(cls, arg: Path) -> Path:
-        """Validates the destination folder path.
+def _validate_move_and_get_destination_file_path(
+    source_file_path: Path, destination_folder_path: Path, path_join_char: str
+) -> Path:
+    """Validates moving a file into a folder and computes its destination file path.
 
-        Ensures that the parent folder exists and is writable, and checks path
-        length limitations for different operating systems.
+    All checks run in a single pass, cheap string checks first and file system probes last,
+    so that each path is stringified and each folder is looked up only once.
 
-        Args:
-            arg (Path): Destination folder path.
+    Args:
+        source_file_path (Path): The source file to move.
+        destination_folder_path (Path): Target folder where the file will be moved.
+        path_join_char (str): Character used to join path components to form the new filename.
 
-        Returns:
-            Path: The validated destination folder path.
+    Returns:
+        Path: The destination file path.
 
-        Raises:
-            FileNotFoundError: If the parent of the destination folder does not exist.
-            PermissionError: If the parent folder is not writable.
-            ValueError: If the destination path length exceeds OS-specific limits.
-        """
+    Raises:
+        ValueError: If the source file does not exist or its path is not absolute,
+            if the path join character appears in the source or destination paths, or
+            if the destination file path length exceeds OS-specific limits.
+        PermissionError: If the source file is not readable, its parent folder is not writable,
+            or the parent of the destination folder is not writable.
+        FileNotFoundError: If the parent of the destination folder does not exist.
+        FileExistsError: If the destination file already exists.
+    """
 
-        dst_parent_path = arg.parent
-        if not dst_parent_path.exists():
-            raise FileNotFoundError(
-                f'Parent of destination folder does not exist.: "{dst_parent_path}"'
-            )
+    if not source_file_path.is_file():
+        raise ValueError(f'A file of the arg path does not exist.: "{source_file_path}"')
+    if not source_file_path.is_absolute():
+        raise ValueError(
+            f'A file of the arg path exists, but the path is not absolute.: "{source_file_path}"'
+        )
 
-        temp_file_path = dst_parent_path / '.tempfile'
-        try:
-            temp_file_path.touch()
-        except PermissionError as err:
-            raise PermissionError(
-                f'No write permission to create destination folder in "{dst_parent_path}".'
-            ) from err
-        os.remove(temp_file_path)
+    source_file_path_str = str(source_file_path)
+    if path_join_char in source_file_path_str:
+        raise ValueError(
+            f'Path joining char "{path_join_char}" is already in the source file path.: {source_file_path}'
+        )
+    if path_join_char in str(destination_folder_path):
+        raise ValueError(
+            f'Path joining char "{path_join_char}" is already in the destination folder path.: {destination_folder_path}'
+        )
 
-        cls.__check_path_length(arg)
+    if not _is_readable_file(source_file_path_str):
+        raise PermissionError(f'No read permission for source file.: "{source_file_path}"')
 
-        return arg
+    src_parent_path = source_file_path.parent
+    if not is_writable_folder(src_parent_path):
+        raise PermissionError(
+            f'No write permission on parent folder of source file.: "{src_parent_path}"'
+        )
 
-    @model_validator(mode='after')
-    def __validate_path_join_char(self) -> Self:
-        """Ensures that the joining character is not already present in the source or destination paths.
+    dst_parent_path = destination_folder_path.parent
+    if not dst_parent_path.exists():
+        raise FileNotFoundError(
+            f'Parent of destination folder does not exist.: "{dst_parent_path}"'
+        )
+    if not is_writable_folder(dst_parent_path):
+        raise PermissionError(
+            f'No write permission to create destination folder in "{dst_parent_path}".'
+        )
 
-        Returns:
-            Self: The validated instance.
+    # Head "/" (or "C:\\" on Windows) will be removed by [1:].
+    new_file_name = path_join_char.join(source_file_path.parts[1:])
+    destination_file_path = destination_folder_path / new_file_name
 
-        Raises:
-            ValueError: If the path join character appears in the source or destination paths.
-        """
+    # Checked before the existence so that a too long path is not passed to stat.
+    # The destination folder path is shorter, so it is covered by this check too.
+    _check_path_length(destination_file_path)
 
-        if self.path_join_char in str(self.source_file_path):
-            raise ValueError(
-                f'Path joining char "{self.path_join_char}" is already in the source file path.: {self.source_file_path}'
-            )
-        if self.path_join_char in str(self.destination_folder_path):
-            raise ValueError(
-                f'Path joining char "{self.path_join_char}" is already in the destination folder path.: {self.destination_folder_path}'
-            )
-        return self
+    if destination_file_path.exists():
+        raise FileExistsError(f'Destination file already exists.: "{destination_file_path}"')
 
-    def __validate_destination_file_path(self):
-        """Validates the computed destination file path.
+    return destination_file_path
 
-        Raises:
-            FileExistsError: If the destination file already exists.
-            ValueError: If the destination file path length exceeds OS-specific limits.
-        """
 
-        if self.__destination_file_path.exists():
-            raise FileExistsError(
-                f'Destination file already exists.: "{self.__destination_file_path}"'
-            )
+def move_file(source_file_path: str | Path, destination_file_path: str | Path):
+    """Moves a file with a rename, falling back to shutil.move across file systems.
 
-        self.__class__.__check_path_length(self.__destination_file_path)
+    Args:
+        source_file_path (str | Path): File to move.
+        destination_file_path (str | Path): Path to move the file to.
+    """
 
-    def __init__(self, **data):
-        """Initializes the configuration and computes the destination file path."""
+    try:
+        # A single rename syscall when both paths are on the same file system.
+        os.rename(source_file_path, destination_file_path)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+        # shutil.move recreates a symlink instead of copying its target.
+        shutil.move(source_file_path, destination_file_path)
 
-        super().__init__(**data)
 
-        # Head "/" (or "C:\\" on Windows) will be removed by [1:].
-        new_file_name = self.path_join_char.join(self.source_file_path.parts[1:])
-        self.__destination_file_path = self.destination_folder_path / new_file_name
+@dataclass(slots=True, frozen=True)
+class MoveFileAsAbsolutePathJoinedNameConfig:
+    """Configuration for moving a file with a destination name derived
+    from its absolute path.
 
-        self.__validate_destination_file_path()
+    A plain slotted dataclass rather than a pydantic model, since one is created per moved file.
+    The path joining char is expected to be validated already (e.g. by ``MoveToConfig``).
+
+    Attributes:
+        source_file_path (Path): The source file to move. Must be an existing absolute path.
+        destination_folder_path (Path): Target folder where the file will be moved.
+        path_join_char (str): Character used to join path components to form the new filename.
+        do_copy (bool):
+            If false, files will be moved.
+            If true, files will be copied and will remain in the original path.
+        destination_file_path (Path): Final computed destination file path.
+    """
+
+    source_file_path: Path
+    destination_folder_path: Path
+    path_join_char: str
+    do_copy: bool
+    destination_file_path: Path = field(init=False)
+
+    def __post_init__(self):
+        """Validates the fields and computes the destination file path."""
+
+        destination_file_path = _validate_move_and_get_destination_file_path(
+            self.source_file_path, self.destination_folder_path, self.path_join_char
+        )
+        object.__setattr__(self, 'destination_file_path', destination_file_path)
 
     def execute(self):
         """Executes the file move or copy operation.
 
-        Creates the destination folder if it does not exist and moves or copies the file
-        to the computed destination path.
+        Moves or copies the file to the computed destination path.
+        The destination folder must have been created beforehand.
         """
 
-        self.destination_folder_path.mkdir(exist_ok=True)
         if not self.do_copy:
-            shutil.move(str(self.source_file_path), self.__destination_file_path)
+            move_file(self.source_file_path, self.destination_file_path)
         else:
-            shutil.copy2(str(self.source_file_path), self.__destination_file_path)
+            shutil.copy2(self.source_file_path, self.destination_file_path)
+
+
+# Buffer size of a log CSV file, large enough to avoid a write syscall per row.
+LOG_BUFFER_SIZE: Final = 1 << 20
+
+# Number of threads moving files concurrently. Moves are I/O-bound and release the GIL.
+MAX_WORKERS: Final = min(32, (os.cpu_count() or 1) * 4)
+
+
+class MoveConfig(Protocol):
+    """A prepared move of a single file, which can be executed and logged."""
 
     @property
-    def destination_file_path(self) -> Path:
-        return self.__destination_file_path
+    def source_file_path(self) -> object: ...
+
+    @property
+    def destination_file_path(self) -> object: ...
+
+    def execute(self) -> None: ...
+
+
+class LogWriter(Protocol):
+    """A CSV writer of a log, as returned by csv.writer."""
+
+    def writerow(self, row: Iterable[object], /) -> Any: ...
+
+
+def execute_and_log(
+    executor: ThreadPoolExecutor,
+    configs: Iterable[MoveConfig],
+    writer: LogWriter,
+    fw: TextIO,
+):
+    """Executes the move configs concurrently and logs them in the given order.
+
+    The moves overlap, but the rows are written in the order of the configs, so that
+    the log is the same from run to run. When a move fails, the moves not started yet
+    are cancelled right away. On any error, whether raised by a move or on this thread
+    (e.g. while writing the log, or KeyboardInterrupt), the running moves are waited
+    for and every finished move is logged before the error is re-raised.
+
+    Args:
+        executor (ThreadPoolExecutor): Executor to run the moves on.
+        configs (Iterable[MoveConfig]): Configs of the moves, in the order to log them.
+        writer (LogWriter): CSV writer of the log.
+        fw (TextIO): Log file, flushed once when all the configs are done.
+
+    Raises:
+        BaseException: The first error in the order of the configs,
+            or the error raised on this thread.
+    """
+
+    submitted_moves: list[tuple[Future[None], MoveConfig]] = []
+    logged_count = 0
+
+    def cancel_pending():
+        for future, _ in submitted_moves:
+            future.cancel()
+
+    def cancel_pending_on_error(future: Future[None]):
+        if not future.cancelled() and future.exception() is not None:
+            cancel_pending()
+
+    try:
+        for config in configs:
+            future = executor.submit(config.execute)
+            future.add_done_callback(cancel_pending_on_error)
+            submitted_moves.append((future, config))
+
+        for future, config in submitted_moves:
+            future.result()
+            writer.writerow((config.source_file_path, config.destination_file_path))
+            logged_count += 1
+
+    except BaseException:
+        cancel_pending()
+        unlogged_moves = submitted_moves[logged_count:]
+        wait([future for future, _ in unlogged_moves])
+        for future, config in unlogged_moves:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                writer.writerow((config.source_file_path, config.destination_file_path))
+            except Exception:
+                # The error being re-raised already reports that the log cannot be written.
+                continue
+        raise
+
+    finally:
+        # Flush once per call, not per row, so that the log stays mostly up to date.
+        fw.flush()
 
 
 def __read_arg_config_path() -> Config:
@@ -609,19 +744,22 @@ def __read_input_txts(input_txts_in_folder_config: TxtsInFolderConfig) -> dict[P
     listed_path_to_txt_paths: dict[Path, list[Path]] = {}
     exceptions: list[Exception] = []
 
-    for txt_path in input_txts_in_folder_config.FOLDER_PATH.file_paths:
+    try:
+        for txt_path in input_txts_in_folder_config.files_containing_folder.iter_file_paths():
 
-        try:
-            listed_paths = PathsListingFile(
-                txt_path, input_txts_in_folder_config.ENCODING
-            ).get_paths()
-        except Exception as err:
-            exceptions.append(err)
-            continue
+            try:
+                listed_paths = PathsListingFile(
+                    txt_path, input_txts_in_folder_config.ENCODING
+                ).get_paths()
+            except Exception as err:
+                exceptions.append(err)
+                continue
 
-        txt_path_to_listed_paths[txt_path] = listed_paths
-        for listed_path in listed_paths:
-            listed_path_to_txt_paths.setdefault(listed_path, []).append(txt_path)
+            txt_path_to_listed_paths[txt_path] = listed_paths
+            for listed_path in listed_paths:
+                listed_path_to_txt_paths.setdefault(listed_path, []).append(txt_path)
+    except Exception as err:
+        exceptions.append(err)
 
     for listed_path, txt_paths in listed_path_to_txt_paths.items():
         if len(txt_paths) <= 1:
@@ -668,16 +806,10 @@ def __prepare_to_move(
         move_configs: list[MoveFileAsAbsolutePathJoinedNameConfig] = []
         for path in listed_paths:
 
-            try:
-                move_from_path = ExistingAbsoluteFilePath(path)
-            except Exception as err:
-                exceptions.append(err)
-                continue
-
             try:
                 move_configs.append(
                     MoveFileAsAbsolutePathJoinedNameConfig(
-                        source_file_path=move_from_path,
+                        source_file_path=path,
                         destination_folder_path=move_to_folder_path,
                         path_join_char=move_to_config.TARGET_FILES_PATH_JOIN_CHAR,
                         do_copy=do_copy,
@@ -707,17 +839,29 @@ def __move_and_log(
 
     Side Effects:
         - Creates a log CSV file with source and destination paths.
+        - Creates destination folders.
         - Moves files from source to destination.
     """
 
-    with move_log_csv_config.PATH.open('w', encoding=str(move_log_csv_config.ENCODING)) as fw:
-        fw.write('move_from,move_to\n')
+    with (
+        move_log_csv_config.PATH.open(
+            'w', buffering=LOG_BUFFER_SIZE, encoding=move_log_csv_config.ENCODING
+        ) as fw,
+        ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor,
+    ):
+        # csv quotes paths containing commas or quotes, which plain joining would break.
+        writer = csv.writer(fw, lineterminator='\n')
+        writer.writerow(('move_from', 'move_to'))
 
         for _, move_configs in txt_path_to_move_configs.items():
-            for move_config in move_configs:
-                move_config.execute()
-                fw.write(f'{move_config.source_file_path},{move_config.destination_file_path}\n')
-                fw.flush()
+            # One mkdir per destination folder instead of one per file.
+            destination_folder_paths = {
+                move_config.destination_folder_path for move_config in move_configs
+            }
+            for destination_folder_path in destination_folder_paths:
+                destination_folder_path.mkdir(exist_ok=True)
+
+            execute_and_log(executor, move_configs, writer, fw)
 
 
 def __move_target_files_into_a_folder():
@@ -1,6 +1,8 @@
+import csv
 import os
-import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from logging import DEBUG, INFO, basicConfig, getLogger
 from pathlib import Path
 from typing import Any, Final
@@ -10,16 +12,19 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     DirectoryPath,
-    Field,
-    PrivateAttr,
-    StrictStr,
     field_validator,
 )
 
 from move_target_files_into_a_folder import (
-    CharsToEscapeInPath,
+    LOG_BUFFER_SIZE,
+    MAX_WORKERS,
     FilesContainingFolder,
     NewTxtConfig,
+    PathJoinChar,
+    YamlSafeLoader,
+    execute_and_log,
+    is_writable_folder,
+    move_file,
 )
 
 
@@ -32,11 +37,7 @@ class UndoMoveToConfig(BaseModel):
     """
 
     FOLDER_PATH: DirectoryPath  # Must be existing directory
-    TARGET_FILES_PATH_JOIN_CHAR: StrictStr = Field(
-        min_length=1, max_length=1, pattern=CharsToEscapeInPath.get_unmatch_char_regex()
-    )
-
-    __files_containing_folders: tuple[FilesContainingFolder, ...] = PrivateAttr()
+    TARGET_FILES_PATH_JOIN_CHAR: PathJoinChar
 
     model_config = ConfigDict(frozen=True, extra='forbid', strict=True)
 
@@ -47,45 +48,41 @@ class UndoMoveToConfig(BaseModel):
             raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
         return Path(arg.strip())
 
-    @field_validator('FOLDER_PATH', mode='after')
-    @classmethod
-    def __validate_folder_path(cls, path: DirectoryPath) -> Path:
-        """Validate that the folder is a writable & readable folder."""
+    def get_files_containing_folders(self) -> tuple[FilesContainingFolder, ...]:
+        """Validates the folder and returns the folders containing the moved files.
 
-        temp_file_path = path / '.tempfile'
-        try:
-            temp_file_path.touch()
-        except PermissionError as err:
-            raise PermissionError(f'No write permission for the folder.: "{path}"') from err
-        os.remove(temp_file_path)
+        The file system is not touched while loading the config, but only here.
+        The folder is scanned once for both the validation and the files containing folders.
+
+        Returns:
+            tuple[FilesContainingFolder, ...]: Folders contained in the folder.
+
+        Raises:
+            PermissionError: If the folder is not readable or not writable.
+            ValueError: If the folder is empty, or if a non-folder object exists in the folder.
+        """
+
+        path = self.FOLDER_PATH
+
+        if not is_writable_folder(path):
+            raise PermissionError(f'No write permission for the folder.: "{path}"')
 
         try:
-            child_paths = list(path.iterdir())
+            with os.scandir(path) as entries:
+                child_entries = tuple(entries)
         except PermissionError as err:
             raise PermissionError(f'No read permission for the folder.: "{path}"') from err
 
-        if not child_paths:
+        if not child_entries:
             raise ValueError(f'No folders were found in MOVE_TO folder.: "{path}"')
 
-        for child_path in child_paths:
-            if not child_path.is_dir():
-                raise ValueError(f'Non-folder object in the folder.: "{path}"')
-
-        return path
-
-    def __init__(self, **data):
-        """Initializes the configuration and computes the files containing folders."""
+        if not all(child_entry.is_dir() for child_entry in child_entries):
+            raise ValueError(f'Non-folder object in the folder.: "{path}"')
 
-        super().__init__(**data)
-
-        self.__files_containing_folders = tuple(
-            FilesContainingFolder(child_path) for child_path in self.FOLDER_PATH.iterdir()
+        return tuple(
+            FilesContainingFolder(Path(child_entry.path)) for child_entry in child_entries
         )
 
-    @property
-    def files_containing_folders(self) -> tuple[FilesContainingFolder, ...]:
-        return self.__files_containing_folders
-
 
 class Config(BaseModel):
     """Main configuration object loaded from YAML.
@@ -111,9 +108,51 @@ class Config(BaseModel):
             Config: Parsed configuration object.
         """
 
-        with open(path, 'r', encoding='utf-8') as fr:
-            content = yaml.safe_load(fr)
-        return cls(**content)
+        with open(path, 'rb') as fr:
+            content = yaml.load(fr, Loader=YamlSafeLoader)
+        return cls.model_validate(content)
+
+
+def _get_original_path_root() -> str:
+    """Returns the root of the original absolute paths of moved files.
+
+    NOTE: Assume that the file is on the same drive as this script file.
+    """
+
+    drive = Path.cwd().drive
+    if drive:  # Windows (e.g. 'C:', '\\\\server\\share'
+        return drive + '\\'
+    else:
+        return '/'
+
+
+# Resolved once, since the working directory does not change during a run.
+_ORIGINAL_PATH_ROOT: Final = _get_original_path_root()
+
+
+def _reconstruct_original_absolute_file_path(file_name: str, path_join_char: str) -> str:
+    """Reconstructs the original absolute file path from a path-joined file name.
+
+    The path is built as a plain string, without splitting the name into parts nor
+    constructing a ``Path``, since the move script never joins empty parts.
+
+    Args:
+        file_name (str): Name of a moved file.
+        path_join_char (str): Character used to join the original path parts.
+
+    Returns:
+        str: The original absolute file path.
+
+    Raises:
+        ValueError: If the path joining char is not in the file name.
+    """
+
+    if path_join_char not in file_name:
+        raise ValueError(
+            f'Path joining char "{path_join_char}" is not in the file name.: "{file_name}"'
+        )
+
+    return _ORIGINAL_PATH_ROOT + file_name.replace(path_join_char, os.sep)
 
 
 class AbsolutePathJoinedNameFilePath:
@@ -125,57 +164,80 @@ class AbsolutePathJoinedNameFilePath:
     absolute file path from that encoded file name.
 
     Attributes:
-        __path (Path): The current file path of the moved file.
-        __original_absolute_file_path (Path):
+        __path_str (str): The current file path of the moved file, cached as a string.
+        __parent_str (str): String form of the parent folder path, cached on construction.
+        __original_absolute_file_path_str (str):
             The reconstructed absolute path where the file originally existed.
     """
 
+    __slots__ = ('__path_str', '__parent_str', '__original_absolute_file_path_str')
+
     def __init__(self, path: Path, path_join_char: str):
 
-        if not isinstance(path, Path):
-            raise TypeError(f'The argument must be a Path object, got "{path}" [{type(path)}].')
-        self.__path = path
+        # Callers pass validated values, so these are only checked in debug runs (not under -O).
+        assert isinstance(
+            path, Path
+        ), f'The argument must be a Path object, got "{path}" [{type(path)}].'
+        assert (
+            isinstance(path_join_char, str) and len(path_join_char) == 1
+        ), f'The argument must be a char, got "{path_join_char}" [{type(path_join_char)}].'
 
-        if not isinstance(path_join_char, str) or len(path_join_char) != 1:
-            raise TypeError(
-                f'The argument must be a char, got "{path_join_char}" [{type(path_join_char)}].'
-            )
+        self.__path_str = os.fspath(path)
+        self.__parent_str = os.path.dirname(self.__path_str)
 
-        self.__original_absolute_file_path = self.__reconstruct_original_absolute_file_path(
-            self.__path.name, path_join_char
+        self.__original_absolute_file_path_str = _reconstruct_original_absolute_file_path(
+            path.name, path_join_char
         )
 
-    @staticmethod
-    def __reconstruct_original_absolute_file_path(file_name: str, path_join_char: str) -> Path:
+    def __str__(self) -> str:
+        return self.__path_str
 
-        parts = file_name.split(path_join_char)
-        if len(parts) == 1:
-            raise ValueError(
-                f'Path joining char "{path_join_char}" is not in the file name.: "{file_name}"'
-            )
+    @property
+    def parent_str(self) -> str:
+        return self.__parent_str
 
-        # NOTE: Assume that the file is on the same drive as this script file.
-        drive = Path.cwd().drive
-        if drive:  # Windows (e.g. 'C:', '\\\\server\\share'
-            root = drive + '\\'
-        else:
-            root = '/'
+    @property
+    def original_absolute_file_path_str(self) -> str:
+        return self.__original_absolute_file_path_str
 
-        return Path(root, *parts)
 
-    def __str__(self) -> str:
-        return self.__path.__str__()
+def _validate_source_file_path(path: AbsolutePathJoinedNameFilePath):
+    """Validates that the parent directory of the source file is writable.
 
-    @property
-    def parent(self) -> Path:
-        return self.__path.parent
+    Read permission of the file itself is not probed. A rename does not need it, and
+    a move across file systems fails with a clear error anyway if the file cannot be read.
 
-    @property
-    def original_absolute_file_path(self) -> Path:
-        return self.__original_absolute_file_path
+    Args:
+        path (AbsolutePathJoinedNameFilePath): The source file path to validate.
+
+    Raises:
+        PermissionError: If the parent folder of the source file is not writable.
+    """
+
+    src_parent_path = path.parent_str
+    if not is_writable_folder(src_parent_path):
+        raise PermissionError(
+            f'No write permission on parent folder of source file.: "{src_parent_path}"'
+        )
+
+
+def _validate_destination_file_path(path: str):
+    """Validates the computed destination file path.
+
+    Raises:
+        FileExistsError: If the destination file already exists.
+        FileNotFoundError: If the parent of the destination file does not exist.
+    """
 
+    if os.path.exists(path):
+        raise FileExistsError(f'Destination file already exists.: "{path}"')
 
-class UndoMoveAbsolutePathJoinedNameFileConfig(BaseModel):
+    if not os.path.exists(os.path.dirname(path)):
+        raise FileNotFoundError(f'Parent of destination file does not exist.: "{path}"')
+
+
+@dataclass(slots=True, frozen=True)
+class UndoMoveAbsolutePathJoinedNameFileConfig:
     """Configuration for restoring a moved file to its original absolute location.
 
     This class validates the accessibility of the moved file, reconstructs
@@ -186,87 +248,27 @@ class UndoMoveAbsolutePathJoinedNameFileConfig(BaseModel):
     Attributes:
         source_file_path (AbsolutePathJoinedNameFilePath):
             The moved file path object representing the file to restore.
-        __destination_file_path (Path):
+        destination_file_path (str):
             The reconstructed original destination path where the file should be restored.
     """
 
     source_file_path: AbsolutePathJoinedNameFilePath
+    destination_file_path: str = field(init=False)
 
-    __destination_file_path: Path = PrivateAttr()
-
-    model_config = ConfigDict(
-        frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
-    )
-
-    @field_validator('source_file_path', mode='after')
-    @classmethod
-    def __validate_source_file_path(
-        cls, arg: AbsolutePathJoinedNameFilePath
-    ) -> AbsolutePathJoinedNameFilePath:
-        """Validates that the source file is readable and its parent directory is writable.
-
-        Args:
-            arg (AbsolutePathJoinedNameFilePath): The source file path to validate.
-
-        Returns:
-            AbsolutePathJoinedNameFilePath: The validated source file path.
-
-        Raises:
-            PermissionError: If the source file is not readable or its parent folder is not writable.
-        """
-
-        try:
-            with open(str(arg), 'rb'):
-                pass
-        except PermissionError as err:
-            raise PermissionError(f'No read permission for source file.: "{arg}"') from err
-
-        src_parent_path = arg.parent
-        temp_file_path = src_parent_path / '.tempfile'
-        try:
-            temp_file_path.touch()
-        except PermissionError as err:
-            raise PermissionError(
-                f'No write permission on parent folder of source file.: "{src_parent_path}"'
-            ) from err
-        os.remove(temp_file_path)
-
-        return arg
-
-    def __validate_destination_file_path(self):
-        """Validates the computed destination file path.
-
-        Raises:
-            FileExistsError: If the destination file already exists.
-            FileNotFoundError: If the parent of the destination file does not exist.
-        """
-
-        if self.__destination_file_path.exists():
-            raise FileExistsError(
-                f'Destination file already exists.: "{self.__destination_file_path}"'
-            )
+    def __post_init__(self):
+        """Validates the source file and computes the destination file path."""
 
-        if not self.__destination_file_path.parent.exists():
-            raise FileNotFoundError(
-                f'Parent of destination file does not exist.: "{self.__destination_file_path}"'
-            )
+        _validate_source_file_path(self.source_file_path)
 
-    def __init__(self, **data):
-        """Initializes the configuration and computes the destination file path."""
+        destination_file_path = self.source_file_path.original_absolute_file_path_str
+        _validate_destination_file_path(destination_file_path)
 
-        super().__init__(**data)
-
-        self.__destination_file_path = self.source_file_path.original_absolute_file_path
-        self.__validate_destination_file_path()
+        object.__setattr__(self, 'destination_file_path', destination_file_path)
 
     def execute(self):
         """Executes the file move operation."""
 
-        shutil.move(str(self.source_file_path), self.__destination_file_path)
-
-    @property
-    def destination_file_path(self) -> Path:
-        return self.__destination_file_path
+        move_file(str(self.source_file_path), self.destination_file_path)
 
 
 def __read_arg_config_path() -> Config:
@@ -297,62 +299,76 @@ def __read_arg_config_path() -> Config:
 
 def __prepare_to_undo_move(
     undo_move_to_config: UndoMoveToConfig,
-) -> dict[Path, list[UndoMoveAbsolutePathJoinedNameFileConfig]]:
+) -> tuple[list[UndoMoveAbsolutePathJoinedNameFileConfig], list[tuple[Path, slice]]]:
     """Prepares undo-move configurations for each file in folders.
 
     Args:
         undo_move_to_config (UndoMoveToConfig): Configuration specifying the undo-move destination.
 
     Returns:
-        dict[Path, list[UndoMoveAbsolutePathJoinedNameFileConfig]]: Mapping of
-            folder paths to lists of move configurations.
+        tuple[list[UndoMoveAbsolutePathJoinedNameFileConfig], list[tuple[Path, slice]]]:
+            Flat list of the move configurations of all folders, and
+            pairs of each folder path and the slice of its move configurations in the list.
 
     Raises:
         ExceptionGroup: If any errors occur while validating or preparing undo-moves.
     """
 
-    folder_path_to_undo_move_configs: dict[
-        Path, list[UndoMoveAbsolutePathJoinedNameFileConfig]
-    ] = {}
+    undo_move_configs: list[UndoMoveAbsolutePathJoinedNameFileConfig] = []
+    folder_path_and_slices: list[tuple[Path, slice]] = []
     exceptions: list[Exception] = []
 
-    for files_containing_folder in undo_move_to_config.files_containing_folders:
-
-        undo_move_configs: list[UndoMoveAbsolutePathJoinedNameFileConfig] = []
-        for path in files_containing_folder.file_paths:
-
-            try:
-                move_from_path = AbsolutePathJoinedNameFilePath(
-                    path, undo_move_to_config.TARGET_FILES_PATH_JOIN_CHAR
-                )
-            except Exception as err:
-                exceptions.append(err)
-                continue
+    try:
+        files_containing_folders = undo_move_to_config.get_files_containing_folders()
+    except Exception as err:
+        exceptions.append(err)
+        files_containing_folders = ()
 
-            try:
-                undo_move_configs.append(
-                    UndoMoveAbsolutePathJoinedNameFileConfig(source_file_path=move_from_path)
-                )
-            except Exception as err:
-                exceptions.append(err)
+    for files_containing_folder in files_containing_folders:
 
-        folder_path_to_undo_move_configs[files_containing_folder.path] = undo_move_configs
+        start = len(undo_move_configs)
+        try:
+            for path in files_containing_folder.iter_file_paths():
+
+                try:
+                    move_from_path = AbsolutePathJoinedNameFilePath(
+                        path, undo_move_to_config.TARGET_FILES_PATH_JOIN_CHAR
+                    )
+                except Exception as err:
+                    exceptions.append(err)
+                    continue
+
+                try:
+                    undo_move_configs.append(
+                        UndoMoveAbsolutePathJoinedNameFileConfig(source_file_path=move_from_path)
+                    )
+                except Exception as err:
+                    exceptions.append(err)
+        except Exception as err:
+            exceptions.append(err)
+
+        folder_path_and_slices.append(
+            (files_containing_folder.path, slice(start, len(undo_move_configs)))
+        )
 
     if exceptions:
         raise ExceptionGroup('Some errors happened while preparing to undo-move.', exceptions)
 
-    return folder_path_to_undo_move_configs
+    return undo_move_configs, folder_path_and_slices
 
 
 def __undo_move_and_log(
-    folder_path_to_undo_move_configs: dict[Path, list[UndoMoveAbsolutePathJoinedNameFileConfig]],
+    undo_move_configs: list[UndoMoveAbsolutePathJoinedNameFileConfig],
+    folder_path_and_slices: list[tuple[Path, slice]],
     move_log_csv_config: NewTxtConfig,
 ):
     """Undo-moves according to the prepared configs and logs the operations.
 
     Args:
-        folder_path_to_undo_move_configs (dict[Path, list[UndoMoveAbsolutePathJoinedNameFileConfig]]):
-            Mapping of folder paths to their associated undo-move configurations.
+        undo_move_configs (list[UndoMoveAbsolutePathJoinedNameFileConfig]):
+            Undo-move configurations of all the folders.
+        folder_path_and_slices (list[tuple[Path, slice]]):
+            Pairs of each folder path and the slice of its undo-move configurations.
         move_log_csv_config (NewTxtConfig): Configuration specifying where to log the moves.
 
     Side Effects:
@@ -360,16 +376,19 @@ def __undo_move_and_log(
         - Moves files from source to destination.
     """
 
-    with move_log_csv_config.PATH.open('w', encoding=str(move_log_csv_config.ENCODING)) as fw:
-        fw.write('move_from,move_to\n')
+    with (
+        move_log_csv_config.PATH.open(
+            'w', buffering=LOG_BUFFER_SIZE, encoding=move_log_csv_config.ENCODING
+        ) as fw,
+        ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor,
+    ):
+        writer = csv.writer(fw, lineterminator='\n')
+        writer.writerow(('move_from', 'move_to'))
 
-        for _, undo_move_configs in folder_path_to_undo_move_configs.items():
-            for undo_move_config in undo_move_configs:
-                undo_move_config.execute()
-                fw.write(
-                    f'{undo_move_config.source_file_path},{undo_move_config.destination_file_path}\n'
-                )
-                fw.flush()
+        # Folders are processed one at a time, so that an error stops the run within
+        # a folder and the log is flushed once per folder.
+        for _, folder_slice in folder_path_and_slices:
+            execute_and_log(executor, undo_move_configs[folder_slice], writer, fw)
 
 
 def __undo_move_target_files_into_a_folder():
@@ -382,7 +401,7 @@ def __undo_move_target_files_into_a_folder():
     CONFIG: Final[Config] = __read_arg_config_path()
 
     try:
-        folder_path_to_undo_move_configs = __prepare_to_undo_move(CONFIG.MOVE_TO)
+        undo_move_configs, folder_path_and_slices = __prepare_to_undo_move(CONFIG.MOVE_TO)
     except ExceptionGroup:
         logger.exception(
             'Script aborted because some errors happened while preparing to undo-move.'
@@ -390,12 +409,10 @@ def __undo_move_target_files_into_a_folder():
         sys.exit(1)
 
     # Confirm on console.
-    total_files_count = 0
-    for folder_path, undo_move_configs in folder_path_to_undo_move_configs.items():
-        containing_files_count = len(undo_move_configs)
-        total_files_count += containing_files_count
+    for folder_path, folder_slice in folder_path_and_slices:
+        containing_files_count = folder_slice.stop - folder_slice.start
         logger.info(f'  {containing_files_count} files in the folder "{folder_path}".')
-    logger.info(f'{total_files_count} files in total.')
+    logger.info(f'{len(undo_move_configs)} files in total.')
 
     input_value = input('Are you sure to undo-move the files? ("yes" or others): ')
     if input_value != 'yes':
@@ -403,7 +420,7 @@ def __undo_move_target_files_into_a_folder():
         return
 
     try:
-        __undo_move_and_log(folder_path_to_undo_move_configs, CONFIG.MOVE_LOG_CSV)
+        __undo_move_and_log(undo_move_configs, folder_path_and_slices, CONFIG.MOVE_LOG_CSV)
     except Exception:
         logger.exception('Script aborted because some errors happened while undo-moving a file.')
         sys.exit(1)